@@ -1,5 +1,10 @@
 from . import utils
 
+BASE_URL = 'https://limitlesstcg.com'
+_TOURNAMENTS_STRAINER = utils.class_strainer('table', 'completed-tournaments')
+_DATA_TABLE_STRAINER = utils.class_strainer('table', 'data-table')
+_DECKLIST_STRAINER = utils.class_strainer('div', 'decklist-card')
+
 def fetch_row_info(row):
     """ given a row, fetch information """
     cells = row.findAll('td')
@@ -14,8 +19,8 @@ def fetch_row_info(row):
 
 
 def fetch_events():
-    base_url = 'https://limitlesstcg.com/tournaments?show=300&time=all'
-    page_html = utils.get_html(base_url)
+    url = f'{BASE_URL}/tournaments?show=300&time=all'
+    page_html = utils.get_html(url, parse_only=_TOURNAMENTS_STRAINER)
     rows = utils.extract_table_rows(page_html, 'completed-tournaments')
     events = []
     for row in rows:
@@ -26,10 +31,9 @@ def fetch_events():
 
 
 def fetch_decklists(tour_id):
-    base_url = 'https://limitlesstcg.com'
-    tour_url = f'{base_url}/tournaments/{tour_id}'
+    tour_url = f'{BASE_URL}/tournaments/{tour_id}'
 
-    html = utils.get_html(tour_url)
+    html = utils.get_html(tour_url, parse_only=_DATA_TABLE_STRAINER)
     rows = utils.extract_table_rows(html, 'data-table')
     decklists = [fetch_row_info(row) for row in rows]
     return decklists
@@ -37,7 +41,7 @@ def fetch_decklists(tour_id):
 
 def fetch_decklist(url):
     """ fetch a decklist from a given url """
-    html = utils.get_html(url)
+    html = utils.get_html(url, parse_only=_DECKLIST_STRAINER)
     soup_cards = html.findAll('div', {'class': 'decklist-card'})
     cards = []
     for soup_card in soup_cards:
@@ -1,9 +1,13 @@
+from bs4 import SoupStrainer
+
 import th_helpers.scraper.utils as utils
 
+BASE_URL = 'https://pokedata.ovh/standings/'
+_BUTTON_STRAINER = SoupStrainer('button')
+
 def prompt_to_get_pokedata_tour_id():
     print('* Finding Tournaments on PokeData')
-    base_url = 'https://pokedata.ovh/standings/'
-    page_html = utils.get_html(base_url)
+    page_html = utils.get_html(BASE_URL, parse_only=_BUTTON_STRAINER)
     buttons = page_html.findAll('button')
     ids = {}
     for i, button in enumerate(buttons[:10]):
@@ -1,13 +1,28 @@
 # package imports
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from contextlib import closing
-from requests import get
+from requests import Session
 
+# shared session so repeated fetches reuse pooled keep-alive connections
+_session = Session()
 
-def get_html(url):
-    """ scrapes a webpage and returns the beautified soup """
-    with closing(get(url, stream=True)) as resp:
-        return BeautifulSoup(resp.content, 'html.parser')
+
+def class_strainer(name, class_name):
+    """ builds a SoupStrainer that token-matches class like find does
+
+    a plain SoupStrainer(name, {'class': x}) only matches an exact class
+    string, so multi-valued classes would be silently dropped
+    """
+    return SoupStrainer(name, class_=lambda c: c and class_name in c.split())
+
+
+def get_html(url, parse_only=None):
+    """ scrapes a webpage and returns the beautified soup
+
+    parse_only accepts a SoupStrainer so only the needed subtree is built
+    """
+    with closing(_session.get(url, stream=True)) as resp:
+        return BeautifulSoup(resp.content, 'lxml', parse_only=parse_only)
 
 
 def extract_table_rows(html, class_name):
@@ -0,0 +1,89 @@
+# package imports
+from bs4 import BeautifulSoup
+
+from th_helpers.scraper import limitless, pokedata, utils
+
+
+# snippets mirror the scraped pages; the extra class tokens make sure the
+# strainers token-match like find instead of requiring an exact class string
+TOURNAMENTS_PAGE = """
+<html><body>
+<nav><a href="/decks">noise</a></nav>
+<table class="completed-tournaments striped">
+<tr><th>Name</th></tr>
+<tr><td><a href="/tournaments/abc">Event A</a></td></tr>
+<tr><td><a href="/tournaments/xyz">Event B</a></td></tr>
+</table>
+</body></html>
+"""
+
+DATA_TABLE_PAGE = """
+<html><body>
+<div class="sidebar">noise</div>
+<table class="data-table striped">
+<tr><th>Place</th></tr>
+<tr><td>1</td></tr>
+<tr><td>2</td></tr>
+</table>
+</body></html>
+"""
+
+DECKLIST_PAGE = """
+<html><body>
+<p>noise</p>
+<div class="decklist-card highlight" data-number="25" data-set="SV">
+<span class="card-count">4</span><span class="card-name">Pikachu</span>
+</div>
+<div class="decklist-card" data-number="26" data-set="SV">
+<span class="card-count">2</span><span class="card-name">Raichu</span>
+</div>
+</body></html>
+"""
+
+BUTTONS_PAGE = """
+<html><body>
+<h1>noise</h1>
+<button onclick="window.location='?tournament=0000128';">Worlds</button>
+<button onclick="window.location='?tournament=0000129';">NAIC</button>
+</body></html>
+"""
+
+
+def strained_soup(page, strainer):
+    return BeautifulSoup(page, 'lxml', parse_only=strainer)
+
+
+def full_soup(page):
+    return BeautifulSoup(page, 'lxml')
+
+
+def test_tournaments_strainer_matches_unstrained_rows():
+    soup = strained_soup(TOURNAMENTS_PAGE, limitless._TOURNAMENTS_STRAINER)
+    rows = utils.extract_table_rows(soup, 'completed-tournaments')
+    full = full_soup(TOURNAMENTS_PAGE)
+    expected = utils.extract_table_rows(full, 'completed-tournaments')
+    assert [r.get_text() for r in rows] == [r.get_text() for r in expected]
+
+
+def test_data_table_strainer_matches_unstrained_rows():
+    soup = strained_soup(DATA_TABLE_PAGE, limitless._DATA_TABLE_STRAINER)
+    rows = utils.extract_table_rows(soup, 'data-table')
+    full = full_soup(DATA_TABLE_PAGE)
+    expected = utils.extract_table_rows(full, 'data-table')
+    assert [r.get_text() for r in rows] == [r.get_text() for r in expected]
+
+
+def test_decklist_strainer_matches_unstrained_cards():
+    soup = strained_soup(DECKLIST_PAGE, limitless._DECKLIST_STRAINER)
+    cards = soup.findAll('div', {'class': 'decklist-card'})
+    expected = full_soup(DECKLIST_PAGE).findAll('div', {'class': 'decklist-card'})
+    assert [c['data-number'] for c in cards] == [c['data-number'] for c in expected]
+    assert [c['data-number'] for c in cards] == ['25', '26']
+
+
+def test_button_strainer_matches_unstrained_buttons():
+    soup = strained_soup(BUTTONS_PAGE, pokedata._BUTTON_STRAINER)
+    buttons = soup.findAll('button')
+    expected = full_soup(BUTTONS_PAGE).findAll('button')
+    assert [b.text for b in buttons] == [b.text for b in expected]
+    assert [b['onclick'] for b in buttons] == [b['onclick'] for b in expected]